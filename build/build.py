@@ -6,7 +6,8 @@ Main build orchestrator for Nxtscape Browser
 import os
 import sys
 import time
-import click
+import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -14,64 +15,53 @@ from typing import Optional
 from context import BuildContext
 from utils import load_config, log_info, log_warning, log_error, log_success, IS_MACOS, IS_WINDOWS, IS_LINUX
 
-# Import modules
-from modules.clean import clean
-from modules.git import setup_git, setup_sparkle
-from modules.patches import apply_patches
-from modules.resources import copy_resources
-from modules.chromium_replace import replace_chromium_files, add_file_to_replacements
-from modules.string_replaces import apply_string_replacements
-from modules.inject import inject_version
-from modules.configure import configure
-from modules.compile import build
-from modules.gcs import upload_package_artifacts, upload_signed_artifacts
-
-# Platform-specific imports
-if IS_MACOS:
-    from modules.sign import sign, sign_universal, check_signing_environment
-    from modules.package import package, package_universal
-    from modules.postbuild import run_postbuild
-elif IS_WINDOWS:
-    from modules.package_windows import package, package_universal, sign_binaries as sign
-    # Windows doesn't have universal signing
-    def sign_universal(contexts: list[BuildContext]) -> bool:
-        log_warning("Universal signing is not supported on Windows")
-        return True
-    def run_postbuild(ctx: BuildContext) -> None:
-        log_warning("Post-build tasks are not implemented for Windows yet")
-elif IS_LINUX:
-    from modules.package_linux import package, package_universal, sign_binaries as sign
-    # Linux doesn't have universal signing
-    def sign_universal(contexts: list[BuildContext]) -> bool:
-        log_warning("Universal signing is not supported on Linux")
-        return True
-    def run_postbuild(ctx: BuildContext) -> None:
-        log_warning("Post-build tasks are not implemented for Linux yet")
-else:
-    # Stub functions for other platforms
-    def sign(ctx: BuildContext) -> bool:
-        log_warning("Signing is not implemented for this platform")
-        return True
-    def sign_universal(contexts: list[BuildContext]) -> bool:
-        log_warning("Universal signing is not implemented for this platform")
-        return True
-    def package(ctx: BuildContext) -> bool:
-        log_warning("Packaging is not implemented for this platform")
-        return True
-    def package_universal(contexts: list[BuildContext]) -> bool:
-        log_warning("Universal packaging is not implemented for this platform")
-        return True
-    def run_postbuild(ctx: BuildContext) -> None:
-        log_warning("Post-build tasks are not implemented for this platform")
-
-from modules.slack import (
-    notify_build_started,
-    notify_build_step,
-    notify_build_success,
-    notify_build_failure,
-    notify_build_interrupted,
-    notify_gcs_upload,
-)
+# Build step modules are imported where they are used so that runs touching
+# only a few steps (or just --help) don't pay for importing all of them
+
+
+def load_platform_steps() -> tuple:
+    """Import platform-specific steps
+
+    Returns (sign, sign_universal, package, package_universal, run_postbuild)
+    """
+    if IS_MACOS:
+        from modules.sign import sign, sign_universal
+        from modules.package import package, package_universal
+        from modules.postbuild import run_postbuild
+    elif IS_WINDOWS:
+        from modules.package_windows import package, package_universal, sign_binaries as sign
+        # Windows doesn't have universal signing
+        def sign_universal(contexts: list[BuildContext]) -> bool:
+            log_warning("Universal signing is not supported on Windows")
+            return True
+        def run_postbuild(ctx: BuildContext) -> None:
+            log_warning("Post-build tasks are not implemented for Windows yet")
+    elif IS_LINUX:
+        from modules.package_linux import package, package_universal, sign_binaries as sign
+        # Linux doesn't have universal signing
+        def sign_universal(contexts: list[BuildContext]) -> bool:
+            log_warning("Universal signing is not supported on Linux")
+            return True
+        def run_postbuild(ctx: BuildContext) -> None:
+            log_warning("Post-build tasks are not implemented for Linux yet")
+    else:
+        # Stub functions for other platforms
+        def sign(ctx: BuildContext) -> bool:
+            log_warning("Signing is not implemented for this platform")
+            return True
+        def sign_universal(contexts: list[BuildContext]) -> bool:
+            log_warning("Universal signing is not implemented for this platform")
+            return True
+        def package(ctx: BuildContext) -> bool:
+            log_warning("Packaging is not implemented for this platform")
+            return True
+        def package_universal(contexts: list[BuildContext]) -> bool:
+            log_warning("Universal packaging is not implemented for this platform")
+            return True
+        def run_postbuild(ctx: BuildContext) -> None:
+            log_warning("Post-build tasks are not implemented for this platform")
+
+    return sign, sign_universal, package, package_universal, run_postbuild
 
 
 def build_main(
@@ -96,6 +86,7 @@ def build_main(
     
     # Check if sign flag is enabled and required environment variables are set
     if sign_flag and IS_MACOS:
+        from modules.sign import check_signing_environment
         if not check_signing_environment():
             sys.exit(1)
     
@@ -115,6 +106,7 @@ def build_main(
     gn_flags_file = None
     architectures = [arch] if arch else []  # Empty list if no arch specified
     universal = False
+    parallel_patch_copy = False
     if config_file:
         config = load_config(config_file)
         log_info(f"📄 Loaded config from: {config_file}")
@@ -137,6 +129,8 @@ def build_main(
             build_flag = config["steps"].get("build", build_flag)
             sign_flag = config["steps"].get("sign", sign_flag)
             package_flag = config["steps"].get("package", package_flag)
+            # Opt-in: only safe when copy_resources destinations don't overlap patched files
+            parallel_patch_copy = config["steps"].get("parallel_patch_copy", False)
 
         # Override slack notifications from config if not explicitly set via CLI
         if "notifications" in config:
@@ -195,6 +189,15 @@ def build_main(
 
     # Notify build started (if enabled)
     if slack_notifications:
+        from modules.slack import (
+            notify_build_started,
+            notify_build_step,
+            notify_build_success,
+            notify_build_failure,
+            notify_build_interrupted,
+            notify_gcs_upload,
+        )
+
         notify_build_started(build_type, str(architectures))
 
     # Run build steps
@@ -202,6 +205,9 @@ def build_main(
         built_contexts = []
         all_gcs_uris = []  # Track all uploaded GCS URIs
 
+        if sign_flag or package_flag:
+            sign, sign_universal, package, package_universal, run_postbuild = load_platform_steps()
+
         # Build each architecture separately
         for arch_name in architectures:
             log_info(f"\n{'='*60}")
@@ -225,18 +231,39 @@ def build_main(
 
             # Clean (only for first architecture to avoid conflicts)
             if clean_flag and arch_name == architectures[0]:
+                from modules.clean import clean
                 clean(ctx)
                 if slack_notifications:
                     notify_build_step("Completed cleaning build artifacts")
 
             # Git setup (only once for first architecture)
+            sparkle_ready = False
             if git_setup_flag and arch_name == architectures[0]:
-                setup_git(ctx)
+                from modules.git import setup_git, setup_sparkle
+                if apply_patches_flag and IS_MACOS:
+                    # Sparkle download doesn't depend on the checkout, so overlap it with fetch/sync
+                    with ThreadPoolExecutor(max_workers=2) as executor:
+                        futures = [
+                            executor.submit(setup_git, ctx),
+                            executor.submit(setup_sparkle, ctx),
+                        ]
+                        for future in futures:
+                            future.result()
+                    sparkle_ready = True
+                else:
+                    setup_git(ctx)
                 if slack_notifications:
                     notify_build_step("Completed Git setup and Chromium source")
 
             # Apply patches (only once for first architecture)
             if apply_patches_flag and arch_name == architectures[0]:
+                from modules.git import setup_sparkle
+                from modules.inject import inject_version
+                from modules.chromium_replace import replace_chromium_files
+                from modules.string_replaces import apply_string_replacements
+                from modules.patches import apply_patches
+                from modules.resources import copy_resources
+
                 # Inject version into manifest files
                 inject_version(ctx)
 
@@ -246,19 +273,27 @@ def build_main(
                 # Then apply string replacements
                 apply_string_replacements(ctx)
 
-                # Setup sparkle (macOS only)
+                # Setup sparkle (macOS only, may already be done alongside git setup)
                 if IS_MACOS:
-                    setup_sparkle(ctx)
+                    if not sparkle_ready:
+                        setup_sparkle(ctx)
                 else:
                     log_info("Skipping Sparkle setup (macOS only)")
 
-                # Apply patches
-                apply_patches(ctx, interactive=patch_interactive, commit_each=patch_commit)
-
+                # Per-step git commits from both steps would race on the index
+                if parallel_patch_copy and not patch_commit:
+                    log_info("Applying patches and copying resources in parallel")
+                    # Patches stay on the main thread so failure prompts and Ctrl-C work
+                    with ThreadPoolExecutor(max_workers=1) as executor:
+                        copy_future = executor.submit(copy_resources, ctx)
+                        apply_patches(ctx, interactive=patch_interactive)
+                        copy_future.result()
+                else:
+                    # Apply patches
+                    apply_patches(ctx, interactive=patch_interactive, commit_each=patch_commit)
 
-                # Copy resources
-                copy_resources(ctx, commit_each=patch_commit)
-                
+                    # Copy resources
+                    copy_resources(ctx, commit_each=patch_commit)
 
                 if slack_notifications:
                     notify_build_step(
@@ -267,6 +302,9 @@ def build_main(
 
             # Build for this architecture
             if build_flag:
+                from modules.configure import configure
+                from modules.compile import build
+
                 if slack_notifications:
                     notify_build_step(f"Started building for {arch_name}")
                 configure(ctx, gn_flags_file)
@@ -300,6 +338,7 @@ def build_main(
                 # Upload to GCS after packaging
                 gcs_uris = []
                 if upload_gcs:
+                    from modules.gcs import upload_package_artifacts
                     success, gcs_uris = upload_package_artifacts(ctx)
                     if not success:
                         log_warning("Failed to upload package artifacts to GCS")
@@ -369,6 +408,7 @@ def build_main(
                 # Upload universal package to GCS
                 universal_gcs_uris = []
                 if upload_gcs:
+                    from modules.gcs import upload_package_artifacts
                     # Use the first context with universal architecture override
                     universal_ctx = built_contexts[0]
                     original_arch = universal_ctx.architecture
@@ -410,107 +450,115 @@ def build_main(
         sys.exit(1)
 
 
-@click.command()
-@click.option(
-    "--config",
-    "-c",
-    type=click.Path(exists=True, path_type=Path),
-    help="Load configuration from YAML file",
-)
-@click.option("--clean", "-C", is_flag=True, default=False, help="Clean before build")
-@click.option("--git-setup", "-g", is_flag=True, default=False, help="Git setup")
-@click.option(
-    "--apply-patches", "-p", is_flag=True, default=False, help="Apply patches"
-)
-@click.option(
-    "--sign", "-s", is_flag=True, default=False, help="Sign and notarize the app"
-)
-@click.option(
-    "--arch",
-    "-a",
-    type=click.Choice(["arm64", "x64"]),
-    default=None,
-    help="Architecture (defaults to platform-specific)",
-)
-@click.option(
-    "--build-type",
-    "-t",
-    type=click.Choice(["debug", "release"]),
-    default="debug",
-    help="Build type",
-)
-@click.option("--package", "-P", is_flag=True, default=False, help="Create package (DMG/AppImage/Installer)")
-@click.option("--build", "-b", is_flag=True, default=False, help="Build")
-@click.option(
-    "--chromium-src",
-    "-S",
-    type=click.Path(exists=False, path_type=Path),
-    help="Path to Chromium source directory",
-)
-@click.option(
-    "--slack-notifications",
-    "-n",
-    is_flag=True,
-    default=False,
-    help="Enable Slack notifications",
-)
-@click.option(
-    "--merge",
-    nargs=2,
-    type=click.Path(path_type=Path),
-    metavar="ARCH1_APP ARCH2_APP",
-    help="Merge two architecture builds: --merge path/to/arch1.app path/to/arch2.app",
-)
-@click.option(
-    "--add-replace",
-    type=click.Path(exists=True, path_type=Path),
-    help="Add a file to chromium_src replacement directory: --add-replace /path/to/chromium/src/file --chromium-src /path/to/chromium/src",
-)
-@click.option(
-    "--string-replace",
-    is_flag=True,
-    default=False,
-    help="Apply string replacements to chromium files",
-)
-@click.option(
-    "--patch-interactive",
-    "-i",
-    is_flag=True,
-    default=False,
-    help="Ask for confirmation before applying each patch",
-)
-@click.option(
-    "--patch-commit",
-    is_flag=True,
-    default=False,
-    help="Create a git commit after applying each patch",
-)
-@click.option(
-    "--no-gcs-upload",
-    is_flag=True,
-    default=False,
-    help="Skip uploading artifacts to Google Cloud Storage",
-)
-def main(
-    config,
-    clean,
-    git_setup,
-    apply_patches,
-    sign,
-    arch,
-    build_type,
-    package,
-    build,
-    chromium_src,
-    slack_notifications,
-    merge,
-    add_replace,
-    string_replace,
-    patch_interactive,
-    patch_commit,
-    no_gcs_upload,
-):
+def existing_path(value: str) -> Path:
+    """argparse type for paths that must already exist"""
+    path = Path(value)
+    if not path.exists():
+        raise argparse.ArgumentTypeError(f"Path '{value}' does not exist.")
+    return path
+
+
+def create_parser() -> argparse.ArgumentParser:
+    """Create the command line parser for the build system"""
+    parser = argparse.ArgumentParser(description="Simple build system for Nxtscape Browser")
+    parser.add_argument(
+        "--config",
+        "-c",
+        type=existing_path,
+        help="Load configuration from YAML file",
+    )
+    parser.add_argument("--clean", "-C", action="store_true", help="Clean before build")
+    parser.add_argument("--git-setup", "-g", action="store_true", help="Git setup")
+    parser.add_argument(
+        "--apply-patches", "-p", action="store_true", help="Apply patches"
+    )
+    parser.add_argument(
+        "--sign", "-s", action="store_true", help="Sign and notarize the app"
+    )
+    parser.add_argument(
+        "--arch",
+        "-a",
+        choices=["arm64", "x64"],
+        default=None,
+        help="Architecture (defaults to platform-specific)",
+    )
+    parser.add_argument(
+        "--build-type",
+        "-t",
+        choices=["debug", "release"],
+        default="debug",
+        help="Build type",
+    )
+    parser.add_argument("--package", "-P", action="store_true", help="Create package (DMG/AppImage/Installer)")
+    parser.add_argument("--build", "-b", action="store_true", help="Build")
+    parser.add_argument(
+        "--chromium-src",
+        "-S",
+        type=Path,
+        help="Path to Chromium source directory",
+    )
+    parser.add_argument(
+        "--slack-notifications",
+        "-n",
+        action="store_true",
+        help="Enable Slack notifications",
+    )
+    parser.add_argument(
+        "--merge",
+        nargs=2,
+        type=Path,
+        metavar=("ARCH1_APP", "ARCH2_APP"),
+        help="Merge two architecture builds: --merge path/to/arch1.app path/to/arch2.app",
+    )
+    parser.add_argument(
+        "--add-replace",
+        type=existing_path,
+        help="Add a file to chromium_src replacement directory: --add-replace /path/to/chromium/src/file --chromium-src /path/to/chromium/src",
+    )
+    parser.add_argument(
+        "--string-replace",
+        action="store_true",
+        help="Apply string replacements to chromium files",
+    )
+    parser.add_argument(
+        "--patch-interactive",
+        "-i",
+        action="store_true",
+        help="Ask for confirmation before applying each patch",
+    )
+    parser.add_argument(
+        "--patch-commit",
+        action="store_true",
+        help="Create a git commit after applying each patch",
+    )
+    parser.add_argument(
+        "--no-gcs-upload",
+        action="store_true",
+        help="Skip uploading artifacts to Google Cloud Storage",
+    )
+    return parser
+
+
+def main(argv: Optional[list[str]] = None):
     """Simple build system for Nxtscape Browser"""
+    args = create_parser().parse_args(argv)
+    config = args.config
+    clean = args.clean
+    git_setup = args.git_setup
+    apply_patches = args.apply_patches
+    sign = args.sign
+    arch = args.arch
+    build_type = args.build_type
+    package = args.package
+    build = args.build
+    chromium_src = args.chromium_src
+    slack_notifications = args.slack_notifications
+    merge = args.merge
+    add_replace = args.add_replace
+    string_replace = args.string_replace
+    patch_interactive = args.patch_interactive
+    patch_commit = args.patch_commit
+    no_gcs_upload = args.no_gcs_upload
 
     # Validate chromium-src for commands that need it
     if add_replace or merge or string_replace or (not config and chromium_src is None):
@@ -558,6 +606,7 @@ def main(
         )
 
         # Apply string replacements
+        from modules.string_replaces import apply_string_replacements
         if apply_string_replacements(ctx):
             sys.exit(0)
         else:
@@ -569,6 +618,7 @@ def main(
         root_dir = Path(__file__).parent.parent
 
         # Call the function from chromium_replace module
+        from modules.chromium_replace import add_file_to_replacements
         if add_file_to_replacements(add_replace, chromium_src, root_dir):
             sys.exit(0)
         else:
@@ -605,4 +655,4 @@ def main(
 
 
 if __name__ == "__main__":
-    main.main(standalone_mode=False)
+    main()
@@ -5,7 +5,9 @@ Build context dataclass to hold all build state
 
 import time
 import sys
+import functools
 from pathlib import Path
+from typing import Optional
 from dataclasses import dataclass
 from utils import (
     log_info, log_error, log_success, log_warning,
@@ -15,9 +17,38 @@ from utils import (
 )
 
 
-@dataclass
+@functools.lru_cache(maxsize=None)
+def read_chromium_version_file(root_dir: Path) -> tuple[tuple[str, str], ...]:
+    """Read CHROMIUM_VERSION once per root as (key, value) pairs"""
+    version_file = join_paths(root_dir, "CHROMIUM_VERSION")
+    try:
+        content = version_file.read_text()
+    except FileNotFoundError:
+        return ()
+    # Parse VERSION file format: MAJOR=137\nMINOR=0\nBUILD=7151\nPATCH=69
+    pairs = []
+    for line in content.strip().split("\n"):
+        key, value = line.split("=")
+        pairs.append((key, value))
+    return tuple(pairs)
+
+
+@functools.lru_cache(maxsize=None)
+def read_nxtscape_version_file(root_dir: Path) -> str:
+    """Read NXTSCAPE_VERSION once per root"""
+    version_file = join_paths(root_dir, "build", "config", "NXTSCAPE_VERSION")
+    try:
+        return version_file.read_text().strip()
+    except FileNotFoundError:
+        return ""
+
+
+@dataclass(slots=True)
 class BuildContext:
-    """Simple dataclass to hold all build state"""
+    """Simple dataclass to hold all build state
+
+    Uses __slots__, so only declared fields can be set on an instance.
+    """
 
     root_dir: Path
     chromium_src: Path = Path()
@@ -33,6 +64,10 @@ class BuildContext:
     nxtscape_chromium_version: str = ""
     start_time: float = 0.0
 
+    # Set by later steps: the created package, and an explicit app path for merges
+    package_path: Optional[Path] = None
+    app_path_override: Optional[Path] = None
+
     # App names - will be set based on platform
     CHROMIUM_APP_NAME: str = ""
     NXTSCAPE_APP_NAME: str = ""
@@ -67,22 +102,15 @@ class BuildContext:
         version_dict = {}
 
         if not self.chromium_version:
-            # Read from VERSION file
-            version_file = join_paths(self.root_dir, "CHROMIUM_VERSION")
-            if version_file.exists():
-                # Parse VERSION file format: MAJOR=137\nMINOR=0\nBUILD=7151\nPATCH=69
-                for line in version_file.read_text().strip().split("\n"):
-                    key, value = line.split("=")
-                    version_dict[key] = value
-
+            # Read from VERSION file (cached across contexts for the same root)
+            version_dict = dict(read_chromium_version_file(self.root_dir))
+            if version_dict:
                 # Construct chromium_version as MAJOR.MINOR.BUILD.PATCH
                 self.chromium_version = f"{version_dict['MAJOR']}.{version_dict['MINOR']}.{version_dict['BUILD']}.{version_dict['PATCH']}"
 
         if not self.nxtscape_version:
-            # Read from NXTSCAPE_VERSION file
-            version_file = join_paths(self.root_dir, "build", "config", "NXTSCAPE_VERSION")
-            if version_file.exists():
-                self.nxtscape_version = version_file.read_text().strip()
+            # Read from NXTSCAPE_VERSION file (cached across contexts for the same root)
+            self.nxtscape_version = read_nxtscape_version_file(self.root_dir)
 
         # Set nxtscape_chromium_version as chromium version with BUILD + nxtscape_version
         if self.chromium_version and self.nxtscape_version and version_dict:
@@ -178,6 +206,8 @@ class BuildContext:
 
     def get_app_path(self) -> Path:
         """Get built app path"""
+        if self.app_path_override:
+            return self.app_path_override
         # For debug builds, check if the app has a different name
         if self.build_type == "debug" and IS_MACOS:
             # Check for debug-branded app name
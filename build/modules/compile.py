@@ -41,10 +41,21 @@ def build(ctx: BuildContext) -> bool:
     
     os.chdir(ctx.chromium_src)
     
-    # Use default autoninja parallelism (it handles this automatically)
     autoninja_cmd = "autoninja.bat" if IS_WINDOWS else "autoninja"
-    log_info("Using default autoninja parallelism")
-    run_command([autoninja_cmd, "-C", ctx.out_dir, "chrome", "chromedriver"])
+    ninja_cmd = [autoninja_cmd, "-C", ctx.out_dir, "chrome", "chromedriver"]
+    
+    # NINJA_JOBS overrides the job count. Otherwise autoninja picks it, except on
+    # Windows where it can under-detect logical CPUs on large VMs
+    jobs = os.environ.get("NINJA_JOBS")
+    if not jobs and IS_WINDOWS:
+        jobs = str(multiprocessing.cpu_count())
+    
+    if jobs:
+        log_info(f"Using {jobs} parallel jobs")
+        ninja_cmd.insert(1, f"-j{jobs}")
+    else:
+        log_info("Using default autoninja parallelism")
+    run_command(ninja_cmd)
     
     # Rename Chromium.app to Nxtscape.app
     app_path = ctx.get_chromium_app_path()
@@ -8,6 +8,7 @@ import sys
 import subprocess
 import shutil
 import tarfile
+import threading
 import urllib.request
 from pathlib import Path
 from context import BuildContext
@@ -18,67 +19,102 @@ def setup_git(ctx: BuildContext) -> bool:
     """Setup git and checkout Chromium"""
     log_info(f"\n🔀 Setting up Chromium {ctx.chromium_version}...")
     
-    os.chdir(ctx.chromium_src)
+    if is_checkout_up_to_date(ctx):
+        log_info(f"⏭️  Chromium is already at {ctx.chromium_version} and synced, skipping git setup")
+        return True
     
     # Fetch all tags and checkout
     log_info("📥 Fetching all tags from remote...")
-    run_command(["git", "fetch", "--tags", "--force"])
+    run_command(["git", "fetch", "--tags", "--force"], cwd=ctx.chromium_src)
     
     # Verify tag exists before checkout
-    result = subprocess.run(["git", "tag", "-l", ctx.chromium_version], 
+    result = subprocess.run(["git", "rev-parse", "--verify", "--quiet", f"refs/tags/{ctx.chromium_version}"],
                            text=True, capture_output=True, cwd=ctx.chromium_src)
-    if not result.stdout or ctx.chromium_version not in result.stdout:
+    if result.returncode != 0:
         log_error(f"Tag {ctx.chromium_version} not found!")
         log_info("Available tags (last 10):")
-        list_result = subprocess.run(["git", "tag", "-l", "--sort=-version:refname"], 
+        list_result = subprocess.run(["git", "for-each-ref", "--sort=-v:refname", "--count=10",
+                                      "--format=%(refname:short)", "refs/tags/"],
                                    text=True, capture_output=True, cwd=ctx.chromium_src)
-        if list_result.stdout:
-            for tag in list_result.stdout.strip().split('\n')[:10]:
-                log_info(f"  {tag}")
+        for tag in list_result.stdout.splitlines():
+            log_info(f"  {tag}")
         raise ValueError(f"Git tag {ctx.chromium_version} not found")
     
     log_info(f"🔀 Checking out tag: {ctx.chromium_version}")
-    run_command(["git", "checkout", f"tags/{ctx.chromium_version}"])
+    run_command(["git", "checkout", f"tags/{ctx.chromium_version}"], cwd=ctx.chromium_src)
     
     # Sync dependencies
     log_info("📥 Syncing dependencies (this may take a while)...")
+    # gclient caps itself at 8 jobs by default, so size the pool to the host
+    jobs = os.cpu_count() or 8
+    # Skip depot_tools self-update on every sync unless the caller asked for it
+    sync_env = os.environ.copy()
+    sync_env.setdefault("DEPOT_TOOLS_UPDATE", "0")
     # Windows gclient doesn't support --shallow flag
     if IS_WINDOWS:
-        run_command(["gclient.bat", "sync", "-D", "--no-history", "--shallow"])
+        run_command(["gclient.bat", "sync", "-D", "--no-history", "--shallow", f"-j{jobs}"],
+                    cwd=ctx.chromium_src, env=sync_env)
     else:
-        run_command(["gclient", "sync", "-D", "--no-history", "--shallow"])
+        run_command(["gclient", "sync", "-D", "--no-history", "--shallow", f"-j{jobs}"],
+                    cwd=ctx.chromium_src, env=sync_env)
     
     log_success("Git setup complete")
     return True
 
 
+def is_checkout_up_to_date(ctx: BuildContext) -> bool:
+    """Check if HEAD is at the version tag and gclient has synced since checkout"""
+    head = subprocess.run(["git", "rev-parse", "HEAD"],
+                          text=True, capture_output=True, cwd=ctx.chromium_src)
+    tag = subprocess.run(["git", "rev-parse", "--verify", "--quiet", f"refs/tags/{ctx.chromium_version}^{{commit}}"],
+                         text=True, capture_output=True, cwd=ctx.chromium_src)
+    if head.returncode != 0 or tag.returncode != 0 or head.stdout.strip() != tag.stdout.strip():
+        return False
+    
+    # .gclient_entries lives in the gclient root (the parent of src) and is
+    # rewritten on every sync; .git/HEAD is rewritten on every checkout
+    try:
+        synced_at = (ctx.chromium_src.parent / ".gclient_entries").stat().st_mtime
+        checked_out_at = (ctx.chromium_src / ".git" / "HEAD").stat().st_mtime
+    except OSError:
+        return False
+    return synced_at > checked_out_at
+
+
 def setup_sparkle(ctx: BuildContext) -> bool:
     """Download and setup Sparkle framework"""
     log_info("\n✨ Setting up Sparkle framework...")
     
     sparkle_dir = ctx.get_sparkle_dir()
     
-    # Clean existing
+    # Clean existing - move it aside and delete it in the background so the
+    # walk over the framework's many small files overlaps the download
+    cleanup_thread = None
     if sparkle_dir.exists():
-        safe_rmtree(sparkle_dir)
+        stale_dir = sparkle_dir.with_name(f"{sparkle_dir.name}.old")
+        safe_rmtree(stale_dir)
+        try:
+            sparkle_dir.rename(stale_dir)
+        except OSError:
+            safe_rmtree(sparkle_dir)
+        else:
+            cleanup_thread = threading.Thread(target=safe_rmtree, args=(stale_dir,), daemon=True)
+            cleanup_thread.start()
     
     sparkle_dir.mkdir(parents=True)
     
     # Download Sparkle
     sparkle_url = ctx.get_sparkle_url()
-    sparkle_archive = sparkle_dir / "sparkle.tar.xz"
-    
-    # Download using urllib (cross-platform)
-    log_info(f"Downloading Sparkle from {sparkle_url}...")
-    urllib.request.urlretrieve(sparkle_url, sparkle_archive)
     
-    # Extract using tarfile module (cross-platform)
-    log_info("Extracting Sparkle...")
-    with tarfile.open(sparkle_archive, 'r:xz') as tar:
-        tar.extractall(sparkle_dir)
+    # Stream the download straight into tarfile (cross-platform) so the
+    # archive never has to be written to disk and read back
+    log_info(f"Downloading and extracting Sparkle from {sparkle_url}...")
+    with urllib.request.urlopen(sparkle_url) as response:
+        with tarfile.open(fileobj=response, mode='r|xz') as tar:
+            tar.extractall(sparkle_dir)
     
-    # Clean up
-    sparkle_archive.unlink()
+    if cleanup_thread:
+        cleanup_thread.join()
     
     log_success("Sparkle setup complete")
     return True
@@ -5,6 +5,8 @@ Slack notification module for Nxtscape build system
 
 import os
 import json
+import queue
+import threading
 import requests
 from typing import Optional, List
 import sys
@@ -13,6 +15,16 @@ sys.path.append(os.path.dirname(os.path.dirname(__file__)))
 from utils import log_info, log_warning, log_error, get_platform
 
 
+# Step notifications are queued and posted in batches from a background thread
+# so a slow webhook never stalls the build
+_BATCH_MAX_MESSAGES = 10
+_BATCH_WAIT_SECONDS = 0.25
+_queue: "queue.Queue[tuple[str, bool]]" = queue.Queue()
+_worker: Optional[threading.Thread] = None
+_worker_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+
+
 def get_slack_webhook_url() -> Optional[str]:
     """Get Slack webhook URL from environment variable"""
     return os.environ.get("SLACK_WEBHOOK_URL")
@@ -31,6 +43,14 @@ def get_os_info() -> tuple[str, str]:
         return "💻", platform.capitalize()
 
 
+def _get_session() -> requests.Session:
+    """Get the shared keep-alive session for webhook posts"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+
 def send_slack_notification(message: str, success: bool = True) -> bool:
     """Send a notification to Slack if webhook URL is configured"""
     webhook_url = get_slack_webhook_url()
@@ -65,7 +85,7 @@ def send_slack_notification(message: str, success: bool = True) -> bool:
     }
     
     try:
-        response = requests.post(
+        response = _get_session().post(
             webhook_url,
             data=json.dumps(payload),
             headers={'Content-Type': 'application/json'},
@@ -84,17 +104,62 @@ def send_slack_notification(message: str, success: bool = True) -> bool:
         return False
 
 
+def _drain_queue() -> None:
+    """Post queued notifications, grouping adjacent ones into a single message"""
+    while True:
+        batch = [_queue.get()]
+        while len(batch) < _BATCH_MAX_MESSAGES:
+            try:
+                batch.append(_queue.get(timeout=_BATCH_WAIT_SECONDS))
+            except queue.Empty:
+                break
+        
+        try:
+            # Keep success and failure messages in separate posts so colors stay right
+            start = 0
+            for i in range(1, len(batch) + 1):
+                if i == len(batch) or batch[i][1] != batch[start][1]:
+                    message = "\n".join(message for message, _ in batch[start:i])
+                    send_slack_notification(message, success=batch[start][1])
+                    start = i
+        except Exception as e:
+            log_warning(f"Failed to send Slack notification: {e}")
+        finally:
+            for _ in batch:
+                _queue.task_done()
+
+
+def queue_slack_notification(message: str, success: bool = True) -> bool:
+    """Queue a notification to be posted in the background"""
+    global _worker
+    if not get_slack_webhook_url():
+        return True
+    
+    with _worker_lock:
+        if _worker is None:
+            _worker = threading.Thread(target=_drain_queue, name="slack-notifications", daemon=True)
+            _worker.start()
+    _queue.put((message, success))
+    return True
+
+
+def flush_notifications() -> None:
+    """Block until all queued notifications have been posted"""
+    if _worker is not None:
+        _queue.join()
+
+
 def notify_build_started(build_type: str, arch: str) -> bool:
     """Notify that build has started"""
     _, os_name = get_os_info()
     message = f"Build started on {os_name} - {build_type} build for {arch}"
-    return send_slack_notification(message, success=True)
+    return queue_slack_notification(message, success=True)
 
 
 def notify_build_step(step_name: str) -> bool:
     """Notify about a build step"""
     message = f"Running step: {step_name}"
-    return send_slack_notification(message, success=True)
+    return queue_slack_notification(message, success=True)
 
 
 def notify_build_success(duration_mins: int, duration_secs: int, gcs_uris: Optional[List[str]] = None) -> bool:
@@ -112,18 +177,21 @@ def notify_build_success(duration_mins: int, duration_secs: int, gcs_uris: Optio
             else:
                 message += f"\n• {uri}"
     
+    flush_notifications()
     return send_slack_notification(message, success=True)
 
 
 def notify_build_failure(error_message: str) -> bool:
     """Notify that build failed"""
     message = f"Build failed: {error_message}"
+    flush_notifications()
     return send_slack_notification(message, success=False)
 
 
 def notify_build_interrupted() -> bool:
     """Notify that build was interrupted"""
     message = "Build was interrupted by user"
+    flush_notifications()
     return send_slack_notification(message, success=False)
 
 
@@ -143,4 +211,4 @@ def notify_gcs_upload(architecture: str, gcs_uris: List[str]) -> bool:
         else:
             message += f"\n• {uri}"
     
-    return send_slack_notification(message, success=True)
+    return queue_slack_notification(message, success=True)
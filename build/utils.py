@@ -5,13 +5,23 @@ Shared utilities for the build system
 
 import os
 import sys
+import copy
+import json
+import hashlib
 import subprocess
 import yaml
 import shutil
+from collections import OrderedDict
 from pathlib import Path
 from typing import Optional, List, Dict, Union
 from datetime import datetime
 
+# Try to import msgspec for faster JSON decoding of config caches
+try:
+    import msgspec
+    MSGSPEC_AVAILABLE = True
+except ImportError:
+    MSGSPEC_AVAILABLE = False
 
 # Platform detection
 IS_WINDOWS = sys.platform == "win32"
@@ -21,6 +31,10 @@ IS_LINUX = sys.platform.startswith("linux")
 # Global log file handle
 _log_file = None
 
+# Parsed YAML configs keyed by resolved path: (size, content_version, config)
+_YAML_CACHE: "OrderedDict[str, tuple[int, str, Dict]]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+
 
 def _ensure_log_file():
     """Ensure log file is created with timestamp"""
@@ -102,7 +116,7 @@ def run_command(
         process = subprocess.Popen(
             cmd,
             cwd=cwd,
-            env=env or os.environ,
+            env=env or None,  # None inherits the environment without rebuilding it per call
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,  # Merge stderr into stdout
             text=True,
@@ -167,17 +181,93 @@ def run_command(
 
 
 def load_config(config_path: Path) -> Dict:
-    """Load configuration from YAML file"""
-    if not config_path.exists():
+    """Load configuration from YAML file
+
+    Parsed configs are cached per path and reused while the file's content
+    version is unchanged. Callers always get a deep copy, so mutating the
+    result never leaks back into the cache.
+    """
+    try:
+        raw = config_path.read_bytes()
+    except FileNotFoundError:
         log_error(f"Config file not found: {config_path}")
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path, "r") as f:
-        config = yaml.safe_load(f)
+    version = get_config_content_version(raw)
+    key = str(config_path.resolve())
+    cached = _YAML_CACHE.get(key)
+    if cached and cached[0] == len(raw) and cached[1] == version:
+        _YAML_CACHE.move_to_end(key)
+        return copy.deepcopy(cached[2])
+
+    config = _read_config_sidecar(config_path, len(raw), version)
+    if config is None:
+        config = yaml.safe_load(raw)
+        _write_config_sidecar(config_path, len(raw), version, config)
+
+    _YAML_CACHE[key] = (len(raw), version, copy.deepcopy(config))
+    _YAML_CACHE.move_to_end(key)
+    if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+        _YAML_CACHE.popitem(last=False)
 
     return config
 
 
+def get_config_content_version(raw: bytes) -> str:
+    """Get the content version of a config as a blake2b digest of its bytes
+
+    Mtimes are not preserved reliably by copies, checkouts or container
+    layers, so cached configs are validated against the file content instead.
+    """
+    return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+
+def get_config_sidecar_path(config_path: Path) -> Path:
+    """Get the JSON sidecar cache path for a YAML config"""
+    return config_path.with_suffix(config_path.suffix + ".cache.json")
+
+
+def _read_config_sidecar(config_path: Path, size: int, version: str) -> Optional[Dict]:
+    """Load config from its JSON sidecar if it matches the given size and content version"""
+    sidecar_path = get_config_sidecar_path(config_path)
+    try:
+        sidecar = _fast_json_load(sidecar_path)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(sidecar, dict):
+        return None
+    if sidecar.get("size") != size or sidecar.get("content_version") != version:
+        return None
+    return sidecar.get("config")
+
+
+def _fast_json_load(path: Path):
+    """Load JSON from a file, using msgspec when it is installed"""
+    if MSGSPEC_AVAILABLE:
+        return msgspec.json.decode(path.read_bytes())
+    return json.loads(path.read_text())
+
+
+def _write_config_sidecar(config_path: Path, size: int, version: str, config: Dict) -> None:
+    """Write parsed config to its JSON sidecar, ignoring any failure"""
+    sidecar_path = get_config_sidecar_path(config_path)
+    try:
+        # JSON turns non-string keys (e.g. 1:, or YAML 1.1 on:/yes:) into strings,
+        # so only cache configs that survive the round trip unchanged
+        if json.loads(json.dumps(config)) != config:
+            raise ValueError("config does not round-trip through JSON")
+        with open(sidecar_path, "w") as f:
+            json.dump({"size": size, "content_version": version, "config": config}, f)
+    except (OSError, TypeError, ValueError) as e:
+        _log_to_file(f"Could not write config cache {sidecar_path}: {e}")
+        # Drop any stale sidecar on a best-effort basis; the cache is only an optimisation
+        try:
+            sidecar_path.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
 # Platform-specific utilities
 def get_platform() -> str:
     """Get platform name in a consistent format"""